@@ -16,6 +16,7 @@ class SenseHatController:
         {"id": 3, "name": "Fire Effect", "desc": "随机火焰粒子"}
     ]
     SEA_LEVEL_PRESSURE = 1013.25  # hPa, 用于计算海拔
+    JOYSTICK_DEBOUNCE = 0.25  # 秒, 同一方向的事件在此时间内只处理一次
 
     def __init__(self, socketio_instance):
         self.socketio = socketio_instance
@@ -26,6 +27,7 @@ class SenseHatController:
         self.current_mode = 0
         self.last_mode = -1
         self.is_on = True
+        self._last_dir_time = {}  # 每个摇杆方向最后一次处理事件的时间 (monotonic)
         
         try:
             self.sense = SenseHat()
@@ -52,6 +54,9 @@ class SenseHatController:
     def _main_loop(self):
         """主循环，负责读取数据、更新LED和通过Socket.IO发送数据。"""
         while True:
+            # 每个周期只读取一次时间，供模拟数据和 LED 动画共用
+            t = time.time()
+
             # 1. 读取传感器数据 (如果硬件存在) 或生成模拟数据
             if self.is_hardware_present:
                 temp = self.sense.get_temperature()
@@ -68,7 +73,6 @@ class SenseHatController:
                 if roll > 180: roll -= 360
             else:
                 # 生成平滑变化的模拟数据
-                t = time.time()
                 temp = 25 + 5 * math.sin(t / 10)
                 humidity = 50 + 10 * math.cos(t / 5)
                 pressure = 1013 + 2 * math.sin(t / 2)
@@ -78,7 +82,7 @@ class SenseHatController:
                 yaw = (t * 15) % 360
 
             # 2. 更新 LED
-            self._draw_leds(pitch, roll, yaw)
+            self._draw_leds(pitch, roll, yaw, t)
 
             # 3. 准备数据包
             data_packet = {
@@ -116,28 +120,34 @@ class SenseHatController:
                 time.sleep(1) # 在模拟模式下，此线程无需执行任何操作
                 continue
 
-            for event in self.sense.stick.get_events():
-                if event.action in (ACTION_PRESSED, ACTION_HELD):
-                    if event.direction == "left":
-                        self.current_mode = (self.current_mode - 1) % len(self.MODES)
-                        self.sense.show_letter(str(self.current_mode), text_colour=[0, 0, 255])
-                        time.sleep(0.5)
-                    elif event.direction == "right":
-                        self.current_mode = (self.current_mode + 1) % len(self.MODES)
-                        self.sense.show_letter(str(self.current_mode), text_colour=[0, 0, 255])
-                        time.sleep(0.5)
-                    elif event.direction == "up":
-                        self.sense.low_light = False
-                    elif event.direction == "down":
-                        self.sense.low_light = True
-                    elif event.direction == "middle":
-                        self.is_on = not self.is_on
-            time.sleep(0.1)
+            # 阻塞等待下一个事件，并丢弃之前积压的事件
+            event = self.sense.stick.wait_for_event(emptybuffer=True)
+            if event.action not in (ACTION_PRESSED, ACTION_HELD):
+                continue
+
+            # 去抖: 忽略同一方向在短时间内的重复事件 (如长按产生的连续事件)
+            now = time.monotonic()
+            if now - self._last_dir_time.get(event.direction, 0.0) < self.JOYSTICK_DEBOUNCE:
+                continue
+            self._last_dir_time[event.direction] = now
+
+            if event.direction == "left":
+                self.current_mode = (self.current_mode - 1) % len(self.MODES)
+                self.sense.show_letter(str(self.current_mode), text_colour=[0, 0, 255])
+            elif event.direction == "right":
+                self.current_mode = (self.current_mode + 1) % len(self.MODES)
+                self.sense.show_letter(str(self.current_mode), text_colour=[0, 0, 255])
+            elif event.direction == "up":
+                self.sense.low_light = False
+            elif event.direction == "down":
+                self.sense.low_light = True
+            elif event.direction == "middle":
+                self.is_on = not self.is_on
 
     def _clamp(self, value, min_value=0, max_value=7):
         return max(min_value, min(value, max_value))
 
-    def _draw_leds(self, pitch, roll, yaw):
+    def _draw_leds(self, pitch, roll, yaw, t):
         """根据当前模式绘制LED矩阵。"""
         if not self.is_hardware_present:
             return # 如果没有硬件，则跳过所有绘制操作
@@ -152,7 +162,6 @@ class SenseHatController:
 
         # 模式 0: 监控模式 (呼吸灯)
         if self.current_mode == 0:
-            t = time.time()
             intensity = int(150 + 100 * math.sin(t * 3))
             color = (0, intensity, 0)
             self.sense.clear()
@@ -174,12 +183,12 @@ class SenseHatController:
         # 模式 2: 彩虹波浪
         elif self.current_mode == 2:
             pixels = []
-            t = time.time() * 2
+            phase = t * 2
             for i in range(64):
                 x, y = i % 8, i // 8
-                r = int(128 + 127 * math.sin(x / 2.0 + t))
-                g = int(128 + 127 * math.sin(y / 2.0 + t))
-                b = int(128 + 127 * math.sin((x + y) / 2.0 + t))
+                r = int(128 + 127 * math.sin(x / 2.0 + phase))
+                g = int(128 + 127 * math.sin(y / 2.0 + phase))
+                b = int(128 + 127 * math.sin((x + y) / 2.0 + phase))
                 pixels.append((r, g, b))
             self.sense.set_pixels(pixels)
 
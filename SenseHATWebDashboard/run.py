@@ -5,6 +5,20 @@ This script initializes all components, wires them together, and starts the
 Flask-SocketIO web server and the background sensor-reading thread.
 """
 
+# eventlet has to patch the standard library before anything else imports it.
+# This makes the loop's sleeps and the socket I/O cooperative. It does not
+# cover the Sense HAT sensor reads, which go through C extensions
+# (RTIMULib / I2C ioctls). Each read still blocks the whole eventlet hub,
+# HTTP and Socket.IO included, for its duration. eventlet is deprecated
+# upstream and prints a deprecation warning on every start.
+try:
+    import eventlet
+
+    eventlet.monkey_patch()
+    ASYNC_MODE = "eventlet"
+except ImportError:
+    ASYNC_MODE = "threading"
+
 from typing import Optional
 
 from flask import Flask
@@ -16,7 +30,7 @@ from src.core.logger import DataLogger
 from src.hardware.display import LEDDisplay
 from src.hardware.sense_driver import SenseHatWrapper
 from src.web.routes import configure_routes
-from src.web.socket_handler import configure_socket_handlers
+from src.web.socket_handler import BroadcastBatcher, configure_socket_handlers
 
 background_thread: Optional[SensorDataThread] = None
 
@@ -43,7 +57,7 @@ def create_app() -> tuple[SocketIO, Flask]:
         static_folder="web_client/static",
     )
     app.config["SECRET_KEY"] = config.SECRET_KEY
-    socketio = SocketIO(app)
+    socketio = SocketIO(app, async_mode=ASYNC_MODE)
 
     sense_wrapper = SenseHatWrapper()
     logger = DataLogger(log_dir=config.LOG_DIRECTORY)
@@ -52,7 +66,11 @@ def create_app() -> tuple[SocketIO, Flask]:
     configure_routes(app)
     configure_socket_handlers(socketio, logger)
 
-    background_thread = SensorDataThread(socketio, sense_wrapper, led_display, logger)
+    broadcaster = BroadcastBatcher(socketio, "sensor_update")
+
+    background_thread = SensorDataThread(
+        socketio, sense_wrapper, led_display, logger, broadcaster
+    )
 
     print("Application initialization complete.")
     return socketio, app
@@ -86,6 +104,7 @@ def main() -> None:
             print("Stopping background thread...")
             background_thread.stop()
             background_thread.join()
+            background_thread.led_display.close()
         print("Application shut down.")
 
 
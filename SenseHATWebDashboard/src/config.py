@@ -19,10 +19,25 @@ SENSOR_READ_INTERVAL: float = 0.1
 # Reason for change: Makes the sensor reading interval a configurable parameter.
 # This is better than a magic number in the code.
 
+# Defines the interval (in seconds) between environmental readings (temperature,
+# pressure, humidity). These change slowly, so they are sampled less often than
+# the IMU; cached values are reused in between.
+ENV_READ_INTERVAL: float = 1.0
+# Reason for change: Reading the environmental sensors on every tick wasted I2C
+# transactions on values that barely change between iterations.
+
+# --- Broadcast Configuration ---
+# The number of clients sent to before the broadcaster yields to other tasks.
+BROADCAST_CHUNK_SIZE: int = 50
+# Reason for change: Lets slow sends to many clients yield to other requests
+# instead of blocking the server for the whole broadcast.
+
 # --- Data Logger Configuration ---
 # Defines the directory where data logs are stored.
 LOG_DIRECTORY: str = "logs"
 # Reason for change: Hardcoded "logs" directory is now a configurable setting.
+# Defines how often (in seconds) buffered records are written to the log file.
+LOG_FLUSH_INTERVAL: float = 1.0
 
 # --- Sense HAT Default/Mock Values ---
 # These values are used when the Sense HAT hardware is not detected.
@@ -76,6 +91,9 @@ JOYSTICK_DIRECTIONS: dict[str, str] = {
 }
 # Reason for change: Replaces magic strings in the joystick handler with named constants
 # to prevent typos and improve code clarity.
+# Events in the same direction arriving within this interval (in seconds) of the
+# last handled one are ignored, so a held stick does not flood the handler.
+JOYSTICK_DEBOUNCE_INTERVAL: float = 0.25
 
 # --- LED Display Configuration ---
 # The RGB color used to briefly show the current mode number on the LED matrix.
@@ -2,8 +2,10 @@
 """Defines the background thread for continuously reading and processing sensor data."""
 
 import time
-from threading import Event, Thread
+from threading import Event
+from typing import Any, Dict, Optional
 
+import msgpack
 from flask_socketio import SocketIO
 
 from .. import config
@@ -11,14 +13,20 @@ from .calculator import pressure_to_altitude
 from .logger import DataLogger
 from ..hardware.display import LEDDisplay
 from ..hardware.sense_driver import SenseHatWrapper
+from ..web.socket_handler import BroadcastBatcher
 
 
-class SensorDataThread(Thread):
+class SensorDataThread:
     """
-    A thread that runs the application's main loop.
+    A background task that runs the application's main loop.
 
     It continuously reads sensor data, handles joystick input, updates the LED
-    display, and emits data to the web client via SocketIO.
+    display, and emits data to the web client via SocketIO. The loop is run
+    with `socketio.start_background_task`, so it uses the same concurrency
+    model as the server (a green thread under eventlet, a daemon thread
+    otherwise) and its sleeps yield to the SocketIO event loop. Under
+    eventlet, the sensor reads themselves are C extension calls that cannot
+    yield, so the server is blocked while each one is in progress.
     """
 
     def __init__(
@@ -27,6 +35,7 @@ class SensorDataThread(Thread):
         sense_wrapper: SenseHatWrapper,
         led_display: LEDDisplay,
         logger: DataLogger,
+        broadcaster: BroadcastBatcher,
     ) -> None:
         """Initializes the thread and the application state.
 
@@ -35,21 +44,38 @@ class SensorDataThread(Thread):
             sense_wrapper: An instance of the Sense HAT hardware wrapper.
             led_display: An instance of the LED display controller.
             logger: An instance of the data logger.
+            broadcaster: The batcher used to send sensor updates to clients.
         """
         # Reason for change: Added a detailed Google-style docstring for clarity.
-        super().__init__()
-        self.daemon = True
-
         # Injected components
         self.socketio = socketio
         self.sense_wrapper = sense_wrapper
         self.led_display = led_display
         self.logger = logger
+        self.broadcaster = broadcaster
 
         # Application state
         self.current_mode: int = 0
         self.is_on: bool = True
         self.stop_event = Event()
+        self._task: Optional[Any] = None
+
+        # Environmental readings are refreshed once every `_env_every` iterations
+        # and cached in between; the IMU is read on every iteration.
+        self._env_every: int = max(
+            1, round(config.ENV_READ_INTERVAL / config.SENSOR_READ_INTERVAL)
+        )
+        self._env_tick: int = 0
+
+        # The data packet is allocated once and its leaf values are updated in
+        # place on every iteration, then packed with a reusable packer.
+        self._packet: Dict[str, Dict[str, Any]] = {
+            'env': {'temp': 0.0, 'humidity': 0.0, 'pressure': 0.0, 'altitude': 0.0},
+            'imu': {'pitch': 0.0, 'roll': 0.0, 'yaw': 0.0},
+            'sys': {'mode_id': 0, 'mode_name': '', 'is_on': True, 'is_recording': False},
+            'joystick': {'direction': '', 'action': ''},
+        }
+        self._packer = msgpack.Packer(use_single_float=True)
 
         # Start the joystick listener and register the callback
         self.sense_wrapper.start_joystick_listener(self._handle_joystick)
@@ -58,7 +84,9 @@ class SensorDataThread(Thread):
         """Callback function to handle joystick events.
 
         This method is called from the SenseHatWrapper's joystick thread.
-        It modifies the application state based on the joystick input.
+        It modifies the application state based on the joystick input and must
+        not block, since events arriving meanwhile are discarded. The mode
+        number stays visible because `LEDDisplay` pauses on a mode change.
 
         Args:
             event_direction: The direction of the joystick event.
@@ -71,13 +99,11 @@ class SensorDataThread(Thread):
             self.sense_wrapper.show_letter(
                 str(self.current_mode), text_colour=config.MODE_DISPLAY_COLOR
             )
-            time.sleep(config.MODE_DISPLAY_DURATION)  # Brief display of the mode number
         elif event_direction == config.JOYSTICK_DIRECTIONS["RIGHT"]:
             self.current_mode = (self.current_mode + 1) % len(config.LED_MODES)
             self.sense_wrapper.show_letter(
                 str(self.current_mode), text_colour=config.MODE_DISPLAY_COLOR
             )
-            time.sleep(config.MODE_DISPLAY_DURATION)
         elif event_direction == config.JOYSTICK_DIRECTIONS["UP"]:
             self.sense_wrapper.set_low_light(False)
         elif event_direction == config.JOYSTICK_DIRECTIONS["DOWN"]:
@@ -92,21 +118,32 @@ class SensorDataThread(Thread):
         This method constitutes the core logic of the application, running in a
         continuous loop until the stop event is set. It performs the following
         actions on each iteration:
-        1. Reads all relevant sensor data from the Sense HAT.
+        1. Reads the IMU, and the environmental sensors every
+           `ENV_READ_INTERVAL` seconds (cached values are reused in between).
         2. Updates the LED matrix display based on the current mode.
-        3. Emits the collected data to the web client via SocketIO.
+        3. Updates the data packet and hands it to the broadcaster for the web clients.
         4. Logs the data to a file if recording is enabled.
         5. Pauses for a configured interval before the next iteration.
         """
         # Reason for change: Added a detailed Google-style docstring for clarity.
         print("Background data-reading thread started.")
+        self.broadcaster.start()
         while not self.stop_event.is_set():
+            # Sample the clock once per tick and share it with everything below
+            now = time.time()
+
             # 1. Read sensor data
-            temp = self.sense_wrapper.get_temperature()
-            pressure = self.sense_wrapper.get_pressure()
-            humidity = self.sense_wrapper.get_humidity()
-            orientation = self.sense_wrapper.get_orientation()
-            altitude = pressure_to_altitude(pressure, config.SEA_LEVEL_PRESSURE)
+            env = self._packet['env']
+            if self._env_tick == 0:
+                pressure = self.sense_wrapper.get_pressure(now)
+                env['temp'] = round(self.sense_wrapper.get_temperature(now), 1)
+                env['humidity'] = round(self.sense_wrapper.get_humidity(now), 1)
+                env['pressure'] = round(pressure, 1)
+                env['altitude'] = round(
+                    pressure_to_altitude(pressure, config.SEA_LEVEL_PRESSURE), 1
+                )
+            self._env_tick = (self._env_tick + 1) % self._env_every
+            orientation = self.sense_wrapper.get_orientation(now)
             
             # Retrieve latest joystick state
             joystick_event = self.sense_wrapper.last_joystick_event
@@ -117,43 +154,46 @@ class SensorDataThread(Thread):
                 mode=self.current_mode,
                 is_on=self.is_on,
                 orientation=orientation,
+                t=now,
             )
 
-            # 3. Prepare data packet
-            data_packet = {
-                'env': {
-                    'temp': round(temp, 1),
-                    'humidity': round(humidity, 1),
-                    'pressure': round(pressure, 1),
-                    'altitude': round(altitude, 1),
-                },
-                'imu': {
-                    'pitch': round(orientation['pitch'], 1),
-                    'roll': round(orientation['roll'], 1),
-                    'yaw': round(orientation['yaw'], 1),
-                },
-                'sys': {
-                    'mode_id': self.current_mode,
-                    'mode_name': config.LED_MODES[self.current_mode]['name'],
-                    'is_on': self.is_on,
-                    'is_recording': self.logger.is_recording,
-                },
-                'joystick': {
-                    'direction': joystick_event['direction'] if joystick_event else '',
-                    'action': joystick_event['action'] if joystick_event else '',
-                },
-            }
-
-            # 4. Emit data to client
-            self.socketio.emit('sensor_update', data_packet)
+            # 3. Update data packet
+            imu = self._packet['imu']
+            imu['pitch'] = round(orientation['pitch'], 1)
+            imu['roll'] = round(orientation['roll'], 1)
+            imu['yaw'] = round(orientation['yaw'], 1)
+
+            mode_id = self.current_mode
+            sys = self._packet['sys']
+            sys['mode_id'] = mode_id
+            sys['mode_name'] = config.LED_MODES[mode_id]['name']
+            sys['is_on'] = self.is_on
+            sys['is_recording'] = self.logger.is_recording
+
+            joystick = self._packet['joystick']
+            joystick['direction'] = joystick_event['direction'] if joystick_event else ''
+            joystick['action'] = joystick_event['action'] if joystick_event else ''
+
+            # 4. Queue data for the client as a MessagePack-encoded binary payload
+            self.broadcaster.publish(self._packer.pack(self._packet))
 
             # 5. Log data if recording
             if self.logger.is_recording:
-                self.logger.record_data(data_packet)
+                self.logger.record_data(self._packet, now)
 
-            time.sleep(config.SENSOR_READ_INTERVAL)
+            self.socketio.sleep(config.SENSOR_READ_INTERVAL)
+        self.broadcaster.stop()
         print("Background data-reading thread stopped.")
 
+    def start(self) -> None:
+        """Starts the main loop as a SocketIO background task."""
+        self._task = self.socketio.start_background_task(self.run)
+
+    def join(self) -> None:
+        """Blocks until the main loop has exited."""
+        if self._task:
+            self._task.join()
+
     def stop(self) -> None:
         """Signals the thread to stop gracefully."""
         # Reason for change: Added a detailed Google-style docstring for clarity.
@@ -1,16 +1,34 @@
 # -*- coding: utf-8 -*-
 """Handles data logging to CSV files."""
 
-import csv
+import math
 import os
+import time
 from datetime import datetime
+from threading import Lock
 from typing import IO, Any, Dict, List, Optional
 
+import numpy as np
+
+from .. import config
+
+# Joystick fields are buffered as small integer codes into these tables.
+_DIRECTIONS: tuple = ('',) + tuple(config.JOYSTICK_DIRECTIONS.values())
+_ACTIONS: tuple = ('', 'pressed', 'held', 'released')
+_DIRECTION_CODES: Dict[str, int] = {d: i for i, d in enumerate(_DIRECTIONS)}
+_ACTION_CODES: Dict[str, int] = {a: i for i, a in enumerate(_ACTIONS)}
+
+# One CSV line per buffered record, in header order.
+_ROW_FORMAT: str = "%s,%.1f,%.1f,%.1f,%.1f,%.1f,%.1f,%.1f,%d,%s,%s,%s\r\n"
+
 
 class DataLogger:
     """A class to handle logging of sensor data to timestamped CSV files.
 
-    This implementation uses the standard `csv` module for robust CSV writing.
+    Records are buffered as numeric rows and written to the CSV file in one
+    batch every `LOG_FLUSH_INTERVAL` seconds (or when the buffer fills, and
+    when logging stops), instead of formatting and writing one row per
+    sensor tick.
     """
 
     def __init__(self, log_dir: str = "logs") -> None:
@@ -24,12 +42,19 @@ class DataLogger:
         self.is_recording: bool = False
         self.log_file_path: Optional[str] = None
         self._file: Optional[IO[str]] = None
-        self._csv_writer: Optional[Any] = None
         self._header: List[str] = [
             'timestamp', 'temp', 'humidity', 'pressure', 'altitude',
             'pitch', 'roll', 'yaw', 'mode_id', 'mode_name',
             'joystick_direction', 'joystick_action'
         ]
+        self._mode_names: Dict[int, str] = {m['id']: m['name'] for m in config.LED_MODES}
+        # Room for two flush intervals' worth of sensor ticks.
+        capacity = 2 * math.ceil(config.LOG_FLUSH_INTERVAL / config.SENSOR_READ_INTERVAL)
+        # Columns: timestamp, 7 sensor values, mode_id, direction code, action code
+        self._buf: np.ndarray = np.empty((capacity, 11), dtype=np.float64)
+        self._count: int = 0  # Records currently in the buffer
+        self._last_flush: float = 0.0  # Timestamp of the record that triggered the last flush
+        self._lock = Lock()
 
     def start(self) -> None:
         """Starts a new logging session.
@@ -47,8 +72,9 @@ class DataLogger:
 
         try:
             self._file = open(self.log_file_path, 'w', newline='', encoding='utf-8')
-            self._csv_writer = csv.writer(self._file)
-            self._csv_writer.writerow(self._header)
+            self._file.write(','.join(self._header) + '\r\n')
+            self._count = 0
+            self._last_flush = time.time()
             self.is_recording = True
             print(f"Logging started. Data will be saved to {self.log_file_path}")
         except IOError as e:
@@ -57,48 +83,95 @@ class DataLogger:
 
     def stop(self) -> None:
         """Stops the current logging session and closes the file."""
-        if not self.is_recording and self._file is None:
-            return
+        with self._lock:
+            if not self.is_recording and self._file is None:
+                return
 
-        if self._file:
-            self._file.close()
+            self._flush()
+            if self._file:
+                self._file.close()
 
-        self.is_recording = False
-        self._file = None
-        self._csv_writer = None
+            self.is_recording = False
+            self._file = None
         print(f"Logging stopped. Log file saved at: {self.log_file_path}")
 
-    def record_data(self, data_packet: Dict[str, Dict[str, Any]]) -> None:
-        """Writes a single data packet to the CSV file.
+    def record_data(
+        self, data_packet: Dict[str, Dict[str, Any]], timestamp: float
+    ) -> None:
+        """Adds a single data packet to the record buffer.
+
+        The buffer is flushed to the CSV file once `LOG_FLUSH_INTERVAL` seconds
+        have passed since the last flush, or when it is full.
 
         Args:
             data_packet (Dict[str, Dict[str, Any]]): The structured sensor
                 data packet containing 'env' and 'imu' dictionaries.
+            timestamp (float): The time the packet was sampled, in seconds
+                since the epoch.
         """
-        if not self.is_recording or not self._csv_writer:
+        if not self.is_recording or not self._file:
             return
 
         env = data_packet.get('env', {})
         imu = data_packet.get('imu', {})
         sys = data_packet.get('sys', {})
         joystick = data_packet.get('joystick', {})
-        timestamp = datetime.now().isoformat()
+        nan = math.nan
 
-        try:
-            self._csv_writer.writerow([
+        with self._lock:
+            self._buf[self._count] = (
                 timestamp,
-                env.get('temp', ''),
-                env.get('humidity', ''),
-                env.get('pressure', ''),
-                env.get('altitude', ''),
-                imu.get('pitch', ''),
-                imu.get('roll', ''),
-                imu.get('yaw', ''),
-                sys.get('mode_id', ''),
-                sys.get('mode_name', ''),
-                joystick.get('direction', ''),
-                joystick.get('action', '')
-            ])
-        except (IOError, csv.Error) as e:
+                env.get('temp', nan),
+                env.get('humidity', nan),
+                env.get('pressure', nan),
+                env.get('altitude', nan),
+                imu.get('pitch', nan),
+                imu.get('roll', nan),
+                imu.get('yaw', nan),
+                sys.get('mode_id', -1),
+                _DIRECTION_CODES.get(joystick.get('direction', ''), 0),
+                _ACTION_CODES.get(joystick.get('action', ''), 0),
+            )
+            self._count += 1
+
+            if (self._count == len(self._buf)
+                    or timestamp - self._last_flush >= config.LOG_FLUSH_INTERVAL):
+                self._last_flush = timestamp
+                self._flush()
+        if not self._file:
+            self.stop()  # A failed flush closed the file; finish shutting down
+
+    def _flush(self) -> None:
+        """Writes all buffered records to the file and empties the buffer.
+
+        Must be called with the lock held. On a write error the pending
+        records are dropped and the file is closed; the caller is
+        responsible for completing the shutdown.
+        """
+        if not self._file or not self._count:
+            return
+
+        rows = self._buf[:self._count]
+        self._count = 0
+
+        # Format the timestamp column in one call, as local time like
+        # datetime.isoformat(). The UTC offset is taken once per batch.
+        offset = time.localtime(rows[0, 0]).tm_gmtoff
+        stamps = np.datetime_as_string(
+            ((rows[:, 0] + offset) * 1e6).astype('datetime64[us]'), unit='us'
+        ).tolist()
+        mode_names = self._mode_names
+
+        try:
+            self._file.write(''.join([
+                _ROW_FORMAT % (stamp, *row[1:9], mode_names.get(int(row[8]), ''),
+                               _DIRECTIONS[int(row[9])], _ACTIONS[int(row[10])])
+                for stamp, row in zip(stamps, rows.tolist())
+            ]))
+        except IOError as e:
             print(f"Error writing to log file: {e}")
-            self.stop()
\ No newline at end of file
+            log_file, self._file = self._file, None
+            try:
+                log_file.close()
+            except IOError:
+                pass
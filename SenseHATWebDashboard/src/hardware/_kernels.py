@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Per-frame pixel kernels for the LED matrix effects.
+
+The kernels write into caller-owned buffers and compute in module-level
+scratch arrays, so no memory is allocated per frame. They are plain NumPy;
+Numba is not used because it has no wheels for the Pi 3B's 32-bit OS.
+"""
+
+import numpy as np
+
+# Per-pixel phase offsets of the rainbow wave for the R, G and B planes,
+# computed once at import.
+_WAVE_X = np.arange(64) % 8 / 2.0
+_WAVE_Y = np.arange(64) // 8 / 2.0
+_WAVE_PHASES = np.stack([_WAVE_X, _WAVE_Y, _WAVE_X + _WAVE_Y])
+_wave_scratch = np.empty_like(_WAVE_PHASES)
+
+
+def rainbow(out: np.ndarray, t: float) -> None:
+    """Fills a (3, 64) uint8 buffer with one frame of the rainbow wave.
+
+    Args:
+        out: The destination buffer, one plane per RGB channel.
+        t: The animation phase in radians.
+    """
+    s = _wave_scratch
+    np.add(_WAVE_PHASES, t, out=s)
+    np.sin(s, out=s)
+    np.multiply(s, 127.0, out=s)
+    np.add(s, 128.0, out=s)
+    np.copyto(out, s, casting="unsafe")
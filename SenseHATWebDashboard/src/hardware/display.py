@@ -5,27 +5,55 @@ This module provides a collection of functions for rendering different
 visualizations on the LED matrix, such as a spirit level or special effects.
 """
 
+import glob
 import math
-import random
+import os
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .. import config
+from ._kernels import rainbow
 
 # Type alias for a SenseHat-like object to avoid circular imports and allow for mocks.
 SenseHatDevice = Any
 
+# The name the Sense HAT kernel driver registers for its framebuffer device.
+SENSE_HAT_FB_NAME = "RPi-Sense FB"
+
 
 def _clamp(value: float, min_value: int = 0, max_value: int = 7) -> int:
     """Clamps a numeric value to be within the 0-7 range for LED coordinates."""
     return max(min_value, min(int(value), max_value))
 
 
+def _open_framebuffer() -> Optional[int]:
+    """Opens the Sense HAT framebuffer device for writing.
+
+    Returns:
+        A file descriptor for the framebuffer, or None if it cannot be found
+        or opened.
+    """
+    for fb_dir in glob.glob("/sys/class/graphics/fb*"):
+        try:
+            with open(os.path.join(fb_dir, "name"), encoding="utf-8") as f:
+                if f.read().strip() != SENSE_HAT_FB_NAME:
+                    continue
+            return os.open(os.path.join("/dev", os.path.basename(fb_dir)), os.O_RDWR)
+        except OSError:
+            continue
+    return None
+
+
 class LEDDisplay:
     """
     Controls the rendering of visualizations on the Sense HAT's 8x8 LED matrix.
 
-    This class is stateless. It receives all necessary information, including the
-    hardware driver, current mode, and sensor data, via the `update_display`
-    method. It then calls the appropriate internal drawing function.
+    Apart from the frame being drawn, this class holds no application state. It
+    receives all necessary information, including the current mode and sensor
+    data, via the `update_display` method. It then calls the appropriate
+    internal drawing function.
     """
 
     def __init__(self, sense_device: Optional[SenseHatDevice]) -> None:
@@ -38,13 +66,27 @@ class LEDDisplay:
         """
         self._sense = sense_device
         self._last_mode_id = -1
-        # Maps mode IDs to their corresponding drawing functions.
-        self._draw_functions = {
-            0: self._draw_monitor_mode,
-            1: self._draw_spirit_level,
-            2: self._draw_rainbow_wave,
-            3: self._draw_fire_effect,
-        }
+        # The frame shared by all modes, stored as separate R, G and B planes of
+        # 64 pixels each. It is zeroed on every mode change, so a mode only has to
+        # write the pixels and channels it uses.
+        self._plane = np.zeros((3, 64), dtype=np.uint8)
+        self._rng = np.random.default_rng()
+        self._monitor_idx = np.array([27, 28, 35, 36])  # (3, 3), (4, 3), (3, 4), (4, 4)
+        # The (x, y, color) last drawn by the spirit level, reset whenever the
+        # matrix is cleared, so that an unchanged frame is not redrawn.
+        self._last_spirit_level: Tuple[int, int, Optional[Tuple[int, int, int]]] = (-1, -1, None)
+        # Framebuffer written directly by `_flush`, bypassing `set_pixels`.
+        # Only the unrotated layout is supported; otherwise fall back to the driver.
+        self._fbfd: Optional[int] = None
+        if self._sense and getattr(self._sense, "rotation", 0) == 0:
+            self._fbfd = _open_framebuffer()
+        # Drawing functions indexed by mode ID.
+        self._draw_functions = (
+            self._draw_monitor_mode,
+            self._draw_spirit_level,
+            self._draw_rainbow_wave,
+            self._draw_fire_effect,
+        )
         if self._sense:
             self._sense.clear()
 
@@ -58,6 +100,7 @@ class LEDDisplay:
         mode: int,
         is_on: bool,
         orientation: Dict[str, float],
+        t: float,
     ) -> None:
         """
         Updates the LED matrix based on the current state and sensor data.
@@ -68,38 +111,67 @@ class LEDDisplay:
             mode: The ID of the current display mode.
             is_on: True if the display should be active, False otherwise.
             orientation: A dictionary with 'pitch' and 'roll' for drawing.
+            t: The timestamp of the current tick, used to drive animations.
         """
         if not self._sense:
             return  # No hardware, nothing to draw
 
         if not is_on:
             self._sense.clear()
+            self._last_spirit_level = (-1, -1, None)
             return
 
         # If mode has changed, clear the screen once before drawing the new mode
         if mode != self._last_mode_id:
-            time.sleep(0.5)  # Brief pause to avoid visual glitches
+            # Brief pause so the mode number shown by the joystick handler stays visible
+            time.sleep(config.MODE_DISPLAY_DURATION)
             self._sense.clear()
+            self._plane.fill(0)
+            self._last_spirit_level = (-1, -1, None)
             self._last_mode_id = mode
 
         # Execute the drawing function for the current mode
-        draw_function = self._draw_functions.get(mode)
-        if draw_function:
-            draw_function(orientation)
+        if 0 <= mode < len(self._draw_functions):
+            self._draw_functions[mode](orientation, t)
 
-    def _draw_monitor_mode(self, orientation: Dict[str, float]) -> None:
+    def _flush(self) -> None:
+        """Writes the current frame planes to the LED matrix.
+
+        The frame is packed to RGB565 and written straight to the framebuffer
+        when it is available, otherwise it is handed to `set_pixels`. If a
+        framebuffer write fails, the framebuffer is closed and this and all
+        later frames go through `set_pixels`.
+        """
+        if self._fbfd is not None:
+            r = self._plane[0].astype(np.uint16) >> 3
+            g = self._plane[1].astype(np.uint16) >> 2
+            b = self._plane[2].astype(np.uint16) >> 3
+            rgb565 = (r << 11) | (g << 5) | b
+            try:
+                os.pwrite(self._fbfd, rgb565.tobytes(), 0)
+                return
+            except OSError as e:
+                print(f"Framebuffer write failed: {e}. Falling back to set_pixels.")
+                self.close()
+        self._sense.set_pixels(self._plane.T.tolist())
+
+    def close(self) -> None:
+        """Closes the framebuffer device, if it is open."""
+        if self._fbfd is None:
+            return
+        try:
+            os.close(self._fbfd)
+        except OSError:
+            pass
+        self._fbfd = None
+
+    def _draw_monitor_mode(self, orientation: Dict[str, float], t: float) -> None:
         """Draws a 'breathing' green square. (Mode 0)"""
-        t = time.time()
         intensity = int(150 + 100 * math.sin(t * 3))
-        color: Tuple[int, int, int] = (0, intensity, 0)
-        pixels = [(0, 0, 0)] * 64
-        pixels[27] = color  # (3, 3)
-        pixels[28] = color  # (4, 3)
-        pixels[35] = color  # (3, 4)
-        pixels[36] = color  # (4, 4)
-        self._sense.set_pixels(pixels)
-
-    def _draw_spirit_level(self, orientation: Dict[str, float]) -> None:
+        self._plane[1, self._monitor_idx] = intensity
+        self._flush()
+
+    def _draw_spirit_level(self, orientation: Dict[str, float], t: float) -> None:
         """Draws a single pixel that moves based on pitch and roll. (Mode 1)"""
         pitch = orientation.get("pitch", 0.0)
         roll = orientation.get("roll", 0.0)
@@ -113,26 +185,25 @@ class LEDDisplay:
         # Color the pixel green if centered, red otherwise
         is_centered = 3 <= target_x <= 4 and 3 <= target_y <= 4
         color: Tuple[int, int, int] = (0, 255, 0) if is_centered else (255, 0, 0)
-        
-        self._sense.clear()
-        self._sense.set_pixel(target_x, target_y, color)
 
-    def _draw_rainbow_wave(self, orientation: Dict[str, float]) -> None:
+        # Skip the write if the target pixel is unchanged since the last frame
+        state = (target_x, target_y, color)
+        if state == self._last_spirit_level:
+            return
+        self._last_spirit_level = state
+
+        self._plane.fill(0)
+        self._plane[:, target_y * 8 + target_x] = color
+        self._flush()
+
+    def _draw_rainbow_wave(self, orientation: Dict[str, float], t: float) -> None:
         """Draws a dynamic, colorful wave. (Mode 2)"""
-        pixels: List[Tuple[int, int, int]] = []
-        t = time.time() * 2
-        for i in range(64):
-            x, y = i % 8, i // 8
-            r = int(128 + 127 * math.sin(x / 2.0 + t))
-            g = int(128 + 127 * math.sin(y / 2.0 + t))
-            b = int(128 + 127 * math.sin((x + y) / 2.0 + t))
-            pixels.append((r, g, b))
-        self._sense.set_pixels(pixels)
-
-    def _draw_fire_effect(self, orientation: Dict[str, float]) -> None:
+        rainbow(self._plane, t * 2)
+        self._flush()
+
+    def _draw_fire_effect(self, orientation: Dict[str, float], t: float) -> None:
         """Draws a simple, randomized fire effect. (Mode 3)"""
-        pixels: List[Tuple[int, int, int]] = [
-            (random.randint(150, 255), random.randint(0, 100), 0)
-            for _ in range(64)
-        ]
-        self._sense.set_pixels(pixels)
+        # The blue plane is left at zero.
+        self._plane[0] = self._rng.integers(150, 256, size=64, dtype=np.uint8)
+        self._plane[1] = self._rng.integers(0, 101, size=64, dtype=np.uint8)
+        self._flush()
@@ -51,20 +51,30 @@ class SenseHatWrapper:
             print("Could not import sense_hat library. Using mock data.")
             self.is_mock = True
 
-    def get_temperature(self) -> float:
+    def get_temperature(self, t: Optional[float] = None) -> float:
         """Reads the temperature from the humidity sensor.
 
+        Args:
+            t: The timestamp used to drive the mock data. Defaults to the
+               current time.
+
         Returns:
             The temperature in degrees Celsius, or a simulated value in mock mode.
         """
         # Reason for change: Added a docstring for clarity.
         if not self.is_mock and self.sense:
             return self.sense.get_temperature()
-        return config.DEFAULT_TEMPERATURE + 5.0 * math.sin(time.time() / 60.0)
+        if t is None:
+            t = time.time()
+        return config.DEFAULT_TEMPERATURE + 5.0 * math.sin(t / 60.0)
 
-    def get_pressure(self) -> float:
+    def get_pressure(self, t: Optional[float] = None) -> float:
         """Reads the atmospheric pressure.
 
+        Args:
+            t: The timestamp used to drive the mock data. Defaults to the
+               current time.
+
         Returns:
             The pressure in hectopascals (hPa), or a simulated value in mock mode.
         """
@@ -81,25 +91,37 @@ class SenseHatWrapper:
             print("Warning: Could not read a valid pressure value. Falling back to default.")
             return config.DEFAULT_PRESSURE
 
-        return config.DEFAULT_PRESSURE + 5.0 * math.cos(time.time() / 30.0)
+        if t is None:
+            t = time.time()
+        return config.DEFAULT_PRESSURE + 5.0 * math.cos(t / 30.0)
 
-    def get_humidity(self) -> float:
+    def get_humidity(self, t: Optional[float] = None) -> float:
         """Reads the percentage relative humidity.
 
+        Args:
+            t: The timestamp used to drive the mock data. Defaults to the
+               current time.
+
         Returns:
             The humidity percentage, or a simulated value in mock mode.
         """
         # Reason for change: Added a docstring for clarity.
         if not self.is_mock and self.sense:
             return self.sense.get_humidity()
-        return config.DEFAULT_HUMIDITY + 10.0 * math.sin(time.time() / 45.0)
+        if t is None:
+            t = time.time()
+        return config.DEFAULT_HUMIDITY + 10.0 * math.sin(t / 45.0)
 
-    def get_orientation(self) -> Dict[str, float]:
+    def get_orientation(self, t: Optional[float] = None) -> Dict[str, float]:
         """Reads the orientation from the IMU sensors.
 
         The pitch and roll values are adjusted to be within the -180 to 180
         degree range, and yaw is 0-360.
 
+        Args:
+            t: The timestamp used to drive the mock data. Defaults to the
+               current time.
+
         Returns:
             A dictionary containing pitch, roll, and yaw in degrees, or
             simulated values in mock mode.
@@ -113,7 +135,8 @@ class SenseHatWrapper:
             return {"pitch": p, "roll": r, "yaw": o["yaw"] % 360}
 
         # Return dynamic mock data for orientation
-        t = time.time()
+        if t is None:
+            t = time.time()
         return {
             "pitch": 30.0 * math.sin(t * 0.5),
             "roll": 45.0 * math.cos(t * 0.3),
@@ -158,11 +181,21 @@ class SenseHatWrapper:
             self.sense.show_letter(*args, **kwargs)
 
     def _joystick_listener(self, callback: Callable[[str], None]) -> None:
-        """Internal method to listen for joystick events."""
+        """Internal method to listen for joystick events.
+
+        Stale events are discarded before each wait, and events repeating the
+        same direction within `JOYSTICK_DEBOUNCE_INTERVAL` are ignored.
+        """
+        last_handled: Dict[str, float] = {}
         while True:
             if not self.is_mock and self.sense and self.sense.stick:
-                event = self.sense.stick.wait_for_event()
+                event = self.sense.stick.wait_for_event(emptybuffer=True)
                 if event.action in (ACTION_PRESSED, ACTION_HELD):
+                    now = time.monotonic()
+                    last = last_handled.get(event.direction)
+                    if last is not None and now - last < config.JOYSTICK_DEBOUNCE_INTERVAL:
+                        continue
+                    last_handled[event.direction] = now
                     self.last_joystick_event = {
                         "direction": event.direction,
                         "action": event.action,
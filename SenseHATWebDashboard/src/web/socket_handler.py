@@ -1,11 +1,105 @@
 # -*- coding: utf-8 -*-
 """Defines SocketIO event handlers for real-time web communication."""
 
-from flask_socketio import SocketIO, emit
+from threading import Event, Lock
+from typing import Any, Optional
 
+from flask_socketio import SocketIO
+
+from src import config
 from src.core.logger import DataLogger
 
 
+class BroadcastBatcher:
+    """Broadcasts the latest packet of an event to all connected clients.
+
+    Producers hand packets to `publish`, which replaces any pending packet and
+    wakes a background sender task, so sends follow the producer's tick.
+    Packets published while a send is still in progress are dropped instead
+    of queueing up; only the latest one is sent afterwards.
+
+    The recipients are sent to in chunks, each as a single `emit` that encodes
+    the packet once for the whole chunk, and the task yields between chunks so
+    a large audience does not starve other requests. The trade-off is one
+    encode per chunk rather than per broadcast, and clients in later chunks
+    receive the packet slightly later than those in the first one.
+    """
+
+    def __init__(
+        self,
+        socketio: SocketIO,
+        event: str,
+        chunk_size: int = config.BROADCAST_CHUNK_SIZE,
+        namespace: str = "/",
+    ) -> None:
+        """Initializes the BroadcastBatcher.
+
+        Args:
+            socketio: The Flask-SocketIO instance.
+            event: The name of the event to broadcast.
+            chunk_size: The number of clients sent to before yielding.
+            namespace: The SocketIO namespace to broadcast on.
+        """
+        self.socketio = socketio
+        self.event = event
+        self.chunk_size = chunk_size
+        self.namespace = namespace
+        self._pending: Optional[Any] = None
+        self._lock = Lock()
+        self._ready = Event()
+        self._running = False
+
+    def publish(self, packet: Any) -> None:
+        """Sets the packet to send next, replacing any pending one.
+
+        Args:
+            packet: The event payload.
+        """
+        with self._lock:
+            self._pending = packet
+        self._ready.set()
+
+    def start(self) -> None:
+        """Starts the background sender task."""
+        if self._running:
+            return
+        self._running = True
+        self.socketio.start_background_task(self._run)
+
+    def stop(self) -> None:
+        """Signals the background sender task to stop."""
+        self._running = False
+        self._ready.set()
+
+    def _run(self) -> None:
+        """Sends the pending packet each time one is published."""
+        while self._running:
+            self._ready.wait()
+            self._ready.clear()
+            with self._lock:
+                packet, self._pending = self._pending, None
+            if packet is not None and self._running:
+                self._send(packet)
+
+    def _send(self, packet: Any) -> None:
+        """Sends a packet to all connected clients, one chunk at a time."""
+        recipients = [
+            sid
+            for sid, _ in self.socketio.server.manager.get_participants(
+                self.namespace, None
+            )
+        ]
+        for start in range(0, len(recipients), self.chunk_size):
+            self.socketio.emit(
+                self.event,
+                packet,
+                to=recipients[start:start + self.chunk_size],
+                namespace=self.namespace,
+            )
+            if start + self.chunk_size < len(recipients):
+                self.socketio.sleep(0)  # Yield to other tasks between chunks
+
+
 def configure_socket_handlers(socketio: SocketIO, logger: DataLogger) -> None:
     """Configures handlers for SocketIO events.
 
@@ -21,9 +115,9 @@ def configure_socket_handlers(socketio: SocketIO, logger: DataLogger) -> None:
     def handle_toggle_recording(data: dict = None) -> None:
         """Handles the 'toggle_recording' event from the client.
 
-        Starts or stops the data logger based on its current state. After
-        changing the state, it broadcasts the new recording status to all
-        connected clients.
+        Starts or stops the data logger based on its current state. The new
+        recording status reaches clients with the next 'sensor_update' packet,
+        which carries it in `sys.is_recording`.
 
         Args:
             data: The data payload from the client (not used).
@@ -31,6 +125,4 @@ def configure_socket_handlers(socketio: SocketIO, logger: DataLogger) -> None:
         if logger.is_recording:
             logger.stop()
         else:
-            logger.start()
-
-        emit("recording_status", {"is_recording": logger.is_recording}, broadcast=True)
\ No newline at end of file
+            logger.start()
\ No newline at end of file